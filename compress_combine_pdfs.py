@@ -12,12 +12,20 @@ Usage:
 """
 
 import argparse
-import io
+import multiprocessing
+import os
+import queue
+import shutil
 import subprocess
 import sys
 import tempfile
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
-from pypdf import PdfReader, PdfWriter
+from typing import Iterable, Iterator
+import pikepdf
 
 
 # Ghostscript quality presets (maps to -dPDFSETTINGS)
@@ -28,62 +36,490 @@ GS_PRESETS = {
     "prepress": "/prepress",   # 300 dpi - highest quality
 }
 
+# Image filters that are already a dedicated image codec; anything else
+# (Flate, LZW, uncompressed) gets re-encoded by Ghostscript
+_IMAGE_CODECS = {"/DCTDecode", "/JPXDecode", "/CCITTFaxDecode", "/JBIG2Decode"}
+
+# General-purpose filters pikepdf can decode to raw pixels
+_GENERAL_FILTERS = {"/FlateDecode", "/LZWDecode", "/RunLengthDecode",
+                    "/ASCII85Decode", "/ASCIIHexDecode"}
+
+# pdfwrite only downsamples images above resolution × this factor
+# (the default -d*ImageDownsampleThreshold for every image type)
+_DOWNSAMPLE_THRESHOLD = 1.5
+
+# Largest decoded image the two-tone pre-pass reads in one piece; plain
+# Flate images are scanned incrementally and aren't limited
+_BILEVEL_MAX_DECODED = 32 * 1024 * 1024
+
+# pikepdf save options for combined output: pack objects into compressed
+# object streams (smaller xref), and copy existing streams verbatim rather
+# than decoding and re-deflating them — gs has already encoded the images
+PDF_SAVE_OPTIONS = {
+    "linearize": False,
+    "object_stream_mode": pikepdf.ObjectStreamMode.generate,
+    "compress_streams": True,
+    "stream_decode_level": pikepdf.StreamDecodeLevel.none,
+}
 
+# Most input PDFs held open at once while combining; macOS allows a
+# process only 256 open files by default
+_MAX_OPEN_SOURCES = 64
+
+# Keys that lead from a page or annotation to other pages (or up into the
+# page tree), so sizing a page doesn't pull in the rest of the document
+_PAGE_LINK_KEYS = {"/Parent", "/P", "/Dest", "/A", "/AA", "/Popup", "/IRT"}
+
+# Split sizing allowances: per indirect object ("n 0 obj ... endobj" and
+# its xref entry), and per part (header, catalog, page tree, trailer)
+_OBJECT_OVERHEAD = 40
+_PART_OVERHEAD = 4096
+
+# Ghostscript flags that don't depend on the preset, dpi or paths
+_GS_STATIC = (
+    "-sDEVICE=pdfwrite",
+    "-dCompatibilityLevel=1.5",
+    "-dNOPAUSE",
+    "-dQUIET",
+    # No input file: gs runs its interactive executive on stdin, which
+    # (unlike "-") executes each statement as soon as it arrives
+    "-dNOPROMPT",
+    # Downsample color images (the heat ramp rasters)
+    "-dDownsampleColorImages=true",
+    "-dColorImageDownsampleType=/Bicubic",
+    # Downsample grayscale
+    "-dDownsampleGrayImages=true",
+    "-dGrayImageDownsampleType=/Bicubic",
+    # Downsample mono (linework stays vector, this is for rasterized mono)
+    "-dDownsampleMonoImages=true",
+    # Compress
+    "-dAutoFilterColorImages=false",
+    "-dColorImageFilter=/DCTEncode",
+    "-dAutoFilterGrayImages=false",
+    "-dGrayImageFilter=/DCTEncode",
+    "-dMonoImageFilter=/CCITTFaxEncode",
+    # Optimize
+    "-dDetectDuplicateImages=true",
+    "-dCompressFonts=true",
+    "-dSubsetFonts=true",
+)
+
+
+@lru_cache(maxsize=1)
 def find_ghostscript() -> str | None:
-    """Find Ghostscript executable on the system."""
+    """Find Ghostscript executable on the system.
+
+    Uses a PATH lookup rather than launching gs --version, which costs a
+    full interpreter start-up just to probe.
+    """
     for cmd in ["gs", "gswin64c", "gswin32c"]:
-        try:
-            subprocess.run([cmd, "--version"], capture_output=True, check=True)
-            return cmd
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            continue
+        path = shutil.which(cmd)
+        if path:
+            return path
     return None
 
 
-def compress_pdf(gs_cmd: str, input_path: Path, output_path: Path,
-                 dpi: int = 200, quality: str = "ebook") -> bool:
-    """Compress a single PDF using Ghostscript."""
-    preset = GS_PRESETS.get(quality, "/ebook")
-
-    args = [
-        gs_cmd,
-        "-sDEVICE=pdfwrite",
-        "-dCompatibilityLevel=1.5",
-        f"-dPDFSETTINGS={preset}",
-        "-dNOPAUSE",
-        "-dQUIET",
-        "-dBATCH",
-        # Downsample color images (the heat ramp rasters)
-        "-dDownsampleColorImages=true",
+@lru_cache(maxsize=16)
+def gs_settings(quality: str, dpi: int) -> tuple[str, ...]:
+    """Return the Ghostscript compression flags for a preset and target dpi.
+
+    -dPDFSETTINGS only supplies defaults for pdfwrite's distiller
+    parameters; anything also given explicitly wins regardless of argument
+    order.  So the preset decides font, colour and compression-threshold
+    behaviour, but image resolution always comes from dpi — e.g. /screen
+    with --dpi 300 keeps 300 dpi images, not the preset's 72.  Raises
+    ValueError for an unknown preset or a non-positive dpi, so bad input
+    is caught before any gs process starts.
+    """
+    if quality not in GS_PRESETS:
+        raise ValueError(f"unknown quality preset {quality!r}")
+    if dpi < 1:
+        raise ValueError(f"dpi must be positive, got {dpi}")
+    return (
+        *_GS_STATIC,
+        f"-dPDFSETTINGS={GS_PRESETS[quality]}",
         f"-dColorImageResolution={dpi}",
-        "-dColorImageDownsampleType=/Bicubic",
-        # Downsample grayscale
-        "-dDownsampleGrayImages=true",
         f"-dGrayImageResolution={dpi}",
-        "-dGrayImageDownsampleType=/Bicubic",
-        # Downsample mono (linework stays vector, this is for rasterized mono)
-        "-dDownsampleMonoImages=true",
+        # Mono rasters are linework, so never go below 300 dpi
         f"-dMonoImageResolution={max(dpi, 300)}",
-        # Compress
-        "-dAutoFilterColorImages=false",
-        "-dColorImageFilter=/DCTEncode",
-        "-dAutoFilterGrayImages=false",
-        "-dGrayImageFilter=/DCTEncode",
-        # Optimize
-        "-dDetectDuplicateImages=true",
-        "-dCompressFonts=true",
-        "-dSubsetFonts=true",
-        f"-sOutputFile={output_path}",
-        str(input_path),
-    ]
-
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"  WARNING: Ghostscript error on {input_path.name}: {result.stderr[:200]}")
+    )
+
+
+def _ps_string(path: Path) -> str:
+    """Escape a filesystem path for use inside a PostScript (string)."""
+    return str(path).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+class GhostscriptSession:
+    """A long-lived Ghostscript interpreter that compresses PDFs one at a time.
+
+    Spawning gs per file pays process start-up and font/resource
+    initialisation on every sheet.  A session launches gs once with the
+    compression settings and feeds it jobs as PostScript on stdin: each job
+    points pdfwrite at a new OutputFile via setpagedevice, runs the input,
+    then switches to an idle file so the output is closed before the
+    result sentinel is printed.  If gs dies it is restarted on the next job.
+    """
+
+    SENTINEL = "@@sheetpress"
+    VM_THRESHOLD = 30_000_000  # bytes allocated between garbage collections
+
+    def __init__(self, gs_cmd: str, work_dir: Path, read_dirs: set[Path],
+                 dpi: int = 200, quality: str = "ebook", name: str = "gs"):
+        self.idle_path = work_dir / f"{name}_idle.pdf"
+        self.args = [
+            gs_cmd,
+            *gs_settings(quality, dpi),
+            # SAFER is on by default: allow reading the inputs and writing
+            # into the work directory, nothing else
+            *(f"--permit-file-read={d}{os.sep}" for d in sorted(read_dirs | {work_dir})),
+            f"--permit-file-write={work_dir}{os.sep}",
+            f"-sOutputFile={self.idle_path}",
+        ]
+        self.proc: subprocess.Popen | None = None
+
+    def _start(self) -> None:
+        self.proc = subprocess.Popen(
+            self.args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace",
+        )
+        # pdfwrite is single-threaded and not a banding device, so
+        # -dNumRenderingThreads/-dBufferSpace do nothing here (parallelism
+        # comes from one session per --jobs worker).  What does help on big
+        # sheets is raising the VM threshold so gs garbage-collects less
+        # often while it holds the document's state.
+        self.proc.stdin.write(f"{self.VM_THRESHOLD} setvmthreshold\n")
+
+    def compress(self, input_path: Path, output_path: Path) -> str | None:
+        """Compress input_path to output_path.
+
+        Returns None on success, or gs's error output on any failure,
+        including a run that left output_path missing or empty.
+        """
+        if self.proc is None or self.proc.poll() is not None:
+            self._start()
+
+        job = (
+            f"{{ << /OutputFile ({_ps_string(output_path)}) >> setpagedevice\n"
+            f"  ({_ps_string(input_path)}) run }} stopped\n"
+            f"{{ clear $error /errorname get == (FAIL) }} {{ (OK) }} ifelse\n"
+            f"{{ << /OutputFile ({_ps_string(self.idle_path)}) >> setpagedevice }} stopped pop\n"
+            f"(\\n{self.SENTINEL} ) print print (\\n) print flush\n"
+        )
+        messages = []
+        status = None
+        try:
+            self.proc.stdin.write(job)
+            self.proc.stdin.flush()
+            for line in self.proc.stdout:
+                if line.startswith(self.SENTINEL):
+                    status = line.split()[-1]
+                    break
+                messages.append(line)
+        except OSError as e:
+            messages.append(str(e))
+
+        # gs can report an unreadable input ("**** Error: Couldn't initialise
+        # file.") without raising, leaving pdfwrite with no pages to write
+        if status == "OK" and (not output_path.exists() or output_path.stat().st_size == 0):
+            status = "EMPTY"
+            messages.append("no pages written")
+
+        if status != "OK":
+            if status is None:
+                # Interpreter exited mid-job, usually without a message; reap
+                # it so the next job restarts it
+                messages.append(f"Ghostscript exited with code {self.proc.wait()}")
+                self.close()
+            return "".join(messages).strip()
+        return None
+
+    def close(self) -> None:
+        """Shut down the interpreter."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.write("quit\n")
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.wait()
+        self.proc.stdout.close()
+        self.proc = None
+
+
+def _iter_images(resources, seen: set) -> Iterator[pikepdf.Stream]:
+    """Yield image XObjects in a resource dictionary, including ones nested
+    inside form XObjects.  Objects already in seen are skipped."""
+    xobjects = resources.get("/XObject") if resources is not None else None
+    if xobjects is None:
+        return
+    for _, xobj in xobjects.items():
+        if not isinstance(xobj, pikepdf.Stream) or xobj.objgen in seen:
+            continue
+        seen.add(xobj.objgen)
+        subtype = xobj.get("/Subtype")
+        if subtype == pikepdf.Name.Image:
+            yield xobj
+        elif subtype == pikepdf.Name.Form:
+            yield from _iter_images(xobj.get("/Resources"), seen)
+
+
+def needs_compression(path: Path, target_dpi: int) -> bool:
+    """Return True if the PDF has raster images Ghostscript would shrink.
+
+    Pure-vector sheets (linework and text) have nothing to downsample, and
+    rewriting them through pdfwrite can even make them larger.  An image
+    counts if it is still stored losslessly (gs would re-encode it) or if
+    its resolution is above the point where gs downsamples, target_dpi
+    times _DOWNSAMPLE_THRESHOLD.  Resolution is estimated against the
+    page size, i.e. assuming the image spans the sheet the way Civil3D's
+    surface rasters do; mono images get the same 300 dpi floor gs uses.
+    Files that can't be scanned (unreadable, or with malformed image
+    dictionaries) return True so gs still gets a chance to repair them.
+    """
+    try:
+        with pikepdf.open(path) as pdf:
+            seen: set = set()
+            for page in pdf.pages:
+                x0, y0, x1, y1 = (float(v) for v in page.mediabox)
+                width_in = abs(x1 - x0) / 72 or 1
+                height_in = abs(y1 - y0) / 72 or 1
+                for image in _iter_images(page.get("/Resources"), seen):
+                    if not any(f in _IMAGE_CODECS for f in _image_filters(image)):
+                        return True
+                    mono = image.get("/BitsPerComponent") == 1 or image.get("/ImageMask", False)
+                    limit = max(target_dpi, 300) if mono else target_dpi
+                    dpi = max(int(image.Width) / width_in, int(image.Height) / height_in)
+                    if dpi > limit * _DOWNSAMPLE_THRESHOLD:
+                        return True
+    except Exception:
+        return True
+    return False
+
+
+def _image_filters(image: pikepdf.Stream) -> list[str]:
+    """Return an image's /Filter entry as a list of filter names."""
+    filters = image.get("/Filter", pikepdf.Array())
+    if isinstance(filters, pikepdf.Name):
+        return [str(filters)]
+    return [str(f) for f in filters]
+
+
+def _decoded_chunks(image: pikepdf.Stream) -> Iterator[bytes]:
+    """Yield an image's decoded data in pieces of at most 1 MB.
+
+    Plain Flate images are inflated incrementally, so a caller that stops
+    early never holds the whole decoded raster.  Other filter chains are
+    decoded in one go.
+    """
+    if _image_filters(image) != ["/FlateDecode"] or "/DecodeParms" in image:
+        yield image.read_bytes()
+        return
+    raw = image.read_raw_bytes()
+    inflater = zlib.decompressobj()
+    for pos in range(0, len(raw), 1 << 16):
+        data = raw[pos:pos + (1 << 16)]
+        while data:
+            yield inflater.decompress(data, 1 << 20)
+            data = inflater.unconsumed_tail
+    yield inflater.flush()
+
+
+def _bilevel_as_mono(image: pikepdf.Stream) -> bool:
+    """Re-store a two-tone 8-bit gray/RGB image as a 1-bit image.
+
+    Ghostscript DCT-encodes every gray and colour image (see the
+    -d*ImageFilter flags), which bloats and blurs scanned text and hatch
+    rasters.  As 1-bit images they go through gs's mono pipeline instead
+    and come out CCITT G4 encoded.  Only images with exactly one or two
+    distinct values are converted (a /Decode array keeps the original
+    tones), so nothing is thresholded.  Rows are checked and packed as
+    they are decoded, so a continuous-tone raster is rejected at its
+    first non-gray pixel or third tone without being decoded in full.
+    Returns True if the image was rewritten.
+    """
+    colorspace = image.get("/ColorSpace")
+    width, height = image.get("/Width"), image.get("/Height")
+    if (image.get("/BitsPerComponent") != 8 or "/Decode" in image
+            or colorspace not in (pikepdf.Name.DeviceGray, pikepdf.Name.DeviceRGB)
+            or not isinstance(width, int) or not isinstance(height, int)
+            or width < 1 or height < 1
+            or not all(f in _GENERAL_FILTERS for f in _image_filters(image))):
+        return False
+    rgb = colorspace == pikepdf.Name.DeviceRGB
+    row_len = width * 3 if rgb else width
+    # Chains that can't be inflated incrementally are decoded whole, so cap them
+    if _image_filters(image) != ["/FlateDecode"] or "/DecodeParms" in image:
+        if row_len * height > _BILEVEL_MAX_DECODED:
+            return False
+
+    row_bytes = (width + 7) // 8
+    pad = b"0" * (row_bytes * 8 - width)
+    tones = b""  # distinct values seen so far, first one first
+    table = b""  # maps tones[0] to ASCII '0', anything else to '1'
+    packed: list[bytes] = []
+    buf = bytearray()
+    try:
+        for chunk in _decoded_chunks(image):
+            buf += chunk
+            while len(buf) >= row_len:
+                if len(packed) == height:
+                    return False  # more data than the image holds
+                row = bytes(buf[:row_len])
+                del buf[:row_len]
+                if rgb:
+                    gray = row[0::3]
+                    if gray != row[1::3] or gray != row[2::3]:
+                        return False
+                    row = gray
+                if not tones:
+                    tones = row[:1]
+                    table = bytes(48 if b == tones[0] else 49 for b in range(256))
+                # Distinct values via C-level deletes rather than a per-pixel loop
+                rest = row.translate(None, tones)
+                while rest:
+                    if len(tones) == 2:
+                        return False
+                    tones += rest[:1]
+                    rest = rest.translate(None, tones)
+                # Parse the row as a base-2 integer of '0'/'1' digits
+                packed.append(int(row.translate(table) + pad, 2).to_bytes(row_bytes, "big"))
+    except (pikepdf.PdfError, zlib.error):
         return False
+    if len(packed) != height or buf:
+        return False
+
+    # Bit 0 is the first tone seen, bit 1 the other one
+    lo, hi = tones[0], tones[-1]
+    image.write(zlib.compress(b"".join(packed)), filter=pikepdf.Name.FlateDecode)
+    image.ColorSpace = pikepdf.Name.DeviceGray
+    image.BitsPerComponent = 1
+    if (lo, hi) != (0, 255):
+        image.Decode = pikepdf.Array([lo / 255, hi / 255])
     return True
 
 
+def convert_bilevel_images(path: Path, output_path: Path) -> bool:
+    """Write a copy of path with its two-tone images stored as 1-bit.
+
+    Returns True if any image was converted and output_path written; the
+    file is left alone (and False returned) otherwise.
+    """
+    try:
+        with pikepdf.open(path) as pdf:
+            seen: set = set()
+            converted = False
+            for page in pdf.pages:
+                for image in _iter_images(page.get("/Resources"), seen):
+                    converted |= _bilevel_as_mono(image)
+            if converted:
+                pdf.save(output_path, **PDF_SAVE_OPTIONS)
+            return converted
+    except pikepdf.PdfError:
+        return False
+
+
+def _prefetch(path: Path) -> None:
+    """Ask the OS to start reading path into the page cache in the background.
+
+    Ghostscript needs random access to a PDF, so feeding it on stdin would
+    only make gs spool it to a temp file.  Instead the kernel is told up
+    front that the whole file is about to be read, so readahead overlaps the
+    pre-scan and gs finds the file cached.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def _scratch_dir(needed_bytes: int) -> str | None:
+    """Pick a RAM-backed directory for intermediate files if one fits.
+
+    Every compressed sheet is written by gs and read straight back by the
+    combine step, so on a slow or network temp disk that round trip adds
+    up.  On Linux /dev/shm is tmpfs; it's used when it has room for
+    needed_bytes (containers often cap it at 64 MB).  Returns None to fall
+    back to the default temp directory.
+    """
+    shm = "/dev/shm"
+    if not os.path.isdir(shm) or not os.access(shm, os.W_OK):
+        return None
+    try:
+        free = shutil.disk_usage(shm).free
+    except OSError:
+        return None
+    return shm if free > needed_bytes else None
+
+
+def _compress_one(idx: int, pdf: Path, tmpdir: Path, dpi: int,
+                  sessions: queue.Queue) -> tuple[int, Path, str, str]:
+    """Compress one input into tmpdir for the worker pool.
+
+    Borrows an idle GhostscriptSession from the pool for the duration of the
+    job.  Returns (idx, path to combine, status, gs error output) where
+    status is "compressed", "skipped" (nothing gs would downsample) or
+    "failed" — the original path is handed back unless compression
+    succeeded, so the sheet is never dropped.  Nothing is printed here, so
+    worker output can't interleave with the progress lines.
+    """
+    _prefetch(pdf)
+    if not needs_compression(pdf, dpi):
+        return idx, pdf, "skipped", ""
+
+    # Two-tone rasters go to gs as 1-bit images so they get CCITT, not DCT
+    bilevel_path = tmpdir / f"bilevel_{idx:03d}.pdf"
+    try:
+        converted = convert_bilevel_images(pdf, bilevel_path)
+    except Exception:
+        # e.g. an image dictionary without /Width; gs gets the original
+        bilevel_path.unlink(missing_ok=True)
+        converted = False
+    gs_input = bilevel_path if converted else pdf.resolve()
+
+    compressed_path = tmpdir / f"compressed_{idx:03d}.pdf"
+    session = sessions.get()
+    try:
+        error = session.compress(gs_input, compressed_path)
+    finally:
+        sessions.put(session)
+    if converted:
+        bilevel_path.unlink()
+    if error is None:
+        return idx, compressed_path, "compressed", ""
+    return idx, pdf, "failed", error
+
+
+def _compressed_in_order(futures: list[Future], pdfs: list[Path]) -> Iterator[Path]:
+    """Yield the path to combine for each input, in input order.
+
+    Blocks on each compression job in turn and reports its result, so the
+    consumer can start on early sheets while later ones are still in gs.
+    """
+    for future in futures:
+        i, path, status, error = future.result()
+        pdf = pdfs[i - 1]
+        if status == "compressed":
+            old_size = get_file_size_mb(pdf)
+            new_size = get_file_size_mb(path)
+            reduction = (1 - new_size / old_size) * 100 if old_size > 0 else 0
+            print(f"[{i}/{len(pdfs)}] {pdf.name}: "
+                  f"{old_size:.1f} MB → {new_size:.1f} MB ({reduction:.0f}% reduction)")
+        elif status == "skipped":
+            print(f"[{i}/{len(pdfs)}] {pdf.name}: nothing to downsample, kept original")
+        else:
+            print(f"  WARNING: Ghostscript error on {pdf.name}: {error[:200]}")
+            print(f"[{i}/{len(pdfs)}] {pdf.name}: failed, using original")
+        yield path
+
+
 def get_file_size_mb(path: Path) -> float:
     return path.stat().st_size / (1024 * 1024)
 
@@ -94,7 +530,14 @@ def collect_pdfs(inputs: list[str]) -> list[Path]:
     for item in inputs:
         p = Path(item)
         if p.is_dir():
-            pdfs.extend(sorted(p.glob("*.pdf")))
+            # One scandir pass: the entry type comes from the directory
+            # listing, so non-PDF entries are never stat'ed.  Sorting Path
+            # objects keeps the platform's ordering (case-insensitive on
+            # Windows), as glob-based collection did
+            with os.scandir(p) as entries:
+                names = [e.name for e in entries
+                         if e.name.lower().endswith(".pdf") and e.is_file()]
+            pdfs.extend(sorted(p / name for name in names))
         elif p.is_file() and p.suffix.lower() == ".pdf":
             pdfs.append(p)
         else:
@@ -102,85 +545,261 @@ def collect_pdfs(inputs: list[str]) -> list[Path]:
     return pdfs
 
 
-def combine_pdfs(pdf_paths: list[Path], output_path: Path,
+def _stream_length(stream: pikepdf.Stream) -> int:
+    """Return a stream's encoded length without reading its data.
+
+    /Length comes from the parsed dictionary, so sizing a page costs no
+    I/O.  Streams with a missing or bogus /Length (which qpdf recovers
+    from when reading) fall back to reading the raw bytes.
+    """
+    length = stream.get("/Length")
+    if isinstance(length, int) and length >= 0:
+        return length
+    return len(stream.read_raw_bytes())
+
+
+def _page_bytes(page: pikepdf.Page, counted: set) -> tuple[int, set]:
+    """Estimate how many bytes a page adds to an output file.
+
+    Walks every object reachable from the page — content, resources and
+    annotation appearances — skipping objects already in counted.  Each
+    stream counts its encoded /Length, and each indirect object its
+    unparsed dictionary plus _OBJECT_OVERHEAD, so the estimate errs
+    high.  Returns the byte count and the set of newly counted objects.
+    """
+    total = 0
+    found: set = set()
+    stack = [page.obj]
+    while stack:
+        obj = stack.pop()
+        if not isinstance(obj, (pikepdf.Array, pikepdf.Dictionary, pikepdf.Stream)):
+            continue
+        if obj.is_indirect:
+            if obj.objgen in counted or obj.objgen in found:
+                continue
+            found.add(obj.objgen)
+            total += _OBJECT_OVERHEAD
+            if isinstance(obj, pikepdf.Stream):
+                total += len(obj.stream_dict.unparse())
+            else:
+                total += len(obj.unparse())
+        if isinstance(obj, pikepdf.Array):
+            stack.extend(obj)
+            continue
+        if isinstance(obj, pikepdf.Stream):
+            total += _stream_length(obj)
+        stack.extend(v for k, v in obj.items() if k not in _PAGE_LINK_KEYS)
+    return total, found
+
+
+def flate_jpeg_images(pages: Iterable[pikepdf.Page], seen: set) -> None:
+    """Deflate JPEG images in place where that makes them smaller.
+
+    JPEG data still compresses a few percent to tens of percent (most on
+    scans with large flat areas), so a /DCTDecode image is rewritten as
+    [/FlateDecode /DCTDecode] when the deflated bytes are smaller.  The
+    JPEG itself is untouched, so this is lossless.  Called on pages of an
+    output Pdf before saving, while its copied images still read from the
+    sources; images already in seen are skipped, so pages can be handed
+    over a batch at a time.
+    """
+    for page in pages:
+        for image in _iter_images(page.obj.get("/Resources"), seen):
+            if _image_filters(image) != ["/DCTDecode"]:
+                continue
+            data = image.read_raw_bytes()
+            deflated = zlib.compress(data, 9)
+            if len(deflated) >= len(data):
+                continue
+            parms = image.get("/DecodeParms")
+            if isinstance(parms, pikepdf.Array):
+                parms = parms[0] if len(parms) else None
+            image.write(
+                deflated,
+                filter=pikepdf.Array([pikepdf.Name.FlateDecode, pikepdf.Name.DCTDecode]),
+                decode_parms=pikepdf.Array([None, parms]) if parms is not None else None,
+            )
+
+
+def _save_output(pdf: pikepdf.Pdf, output_path: Path) -> None:
+    """Save a finished output and drop it from the page cache.
+
+    A multi-GB sheet set would otherwise sit in the page cache after the
+    run, evicting the inputs and whatever else was cached.  The file is
+    written through a large buffer, synced, and the kernel told it won't
+    be read back.
+    """
+    # O_BINARY (Windows only) stops the CRT translating LF to CRLF
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(output_path, flags, 0o644)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+        pdf.save(f, **PDF_SAVE_OPTIONS)
+        f.flush()
+        os.fsync(fd)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _save_pages(output_path: Path,
+                runs: Iterable[tuple[Path | pikepdf.Pdf, int, int | None]]) -> int:
+    """Save the (source, start, stop) page runs as one PDF.
+
+    A source is either an open Pdf, which must stay open until this
+    returns, or a path, which is opened here (stop None means to the last
+    page).  Each run is copied, and its JPEGs deflated, as it arrives.
+    Copied pages read from their source until saved, so once
+    _MAX_OPEN_SOURCES paths are open the output so far is saved to a
+    scratch file beside output_path and reopened, and those sources are
+    closed.  Returns the number of pages written.
+    """
+    out = pikepdf.new()
+    opened: list[pikepdf.Pdf] = []
+    scratch = [output_path.with_name(f".{output_path.name}.{n}.tmp") for n in (0, 1)]
+    checkpoints = 0
+    try:
+        seen: set = set()
+        for src, start, stop in runs:
+            if not isinstance(src, pikepdf.Pdf):
+                if len(opened) == _MAX_OPEN_SOURCES:
+                    # Alternate scratch files: out still reads from the last one
+                    checkpoint = scratch[checkpoints % 2]
+                    out.save(checkpoint, **PDF_SAVE_OPTIONS)
+                    out.close()
+                    for done in opened:
+                        done.close()
+                    opened.clear()
+                    out = pikepdf.open(checkpoint)
+                    checkpoints += 1
+                    seen = set()
+                src = pikepdf.open(src)
+                opened.append(src)
+            first = len(out.pages)
+            out.pages.extend(src.pages[start:stop])
+            flate_jpeg_images(out.pages[first:], seen)
+        _save_output(out, output_path)
+        return len(out.pages)
+    finally:
+        out.close()
+        for src in opened:
+            src.close()
+        for path in scratch:
+            path.unlink(missing_ok=True)
+
+
+def _write_part(part_path: Path, runs: list[tuple[Path, int, int]]) -> tuple[Path, int]:
+    """Build and save one split part from (path, start, stop) page runs.
+
+    Runs in a worker process: pikepdf holds the GIL while saving, and a
+    source Pdf can't be shared between processes, so each worker opens
+    its own handles.  Returns the part path and its page count.
+    """
+    return part_path, _save_pages(part_path, runs)
+
+
+def combine_pdfs(pdf_paths: Iterable[Path], output_path: Path,
                  max_size_mb: float | None = None) -> list[Path]:
     """Combine PDFs into one or more output files.
 
-    If max_size_mb is set, splits into multiple files so each part stays
-    under the size limit.  Pages are added one at a time and the actual
-    output size is measured to decide where to split.
+    pdf_paths is consumed lazily, so it can be a stream of files still
+    being produced (see _compressed_in_order).  If max_size_mb is set,
+    splits into multiple files so each part stays under the size limit,
+    using the per-page estimate from _page_bytes.
 
     Returns list of output file paths created.
     """
     if max_size_mb is None:
-        writer = PdfWriter()
-        for pdf in pdf_paths:
-            writer.append(str(pdf))
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        # Each source is copied as it arrives, so only the save is left
+        # once the last sheet is compressed
+        _save_pages(output_path, ((pdf, 0, None) for pdf in pdf_paths))
         return [output_path]
 
     max_size_bytes = int(max_size_mb * 1024 * 1024)
 
-    # Read all pages from all input PDFs
-    all_pages = []
-    for pdf_path in pdf_paths:
-        reader = PdfReader(str(pdf_path))
-        for page in reader.pages:
-            all_pages.append(page)
-
-    if not all_pages:
-        return []
-
     stem = output_path.stem
     suffix = output_path.suffix
     parent = output_path.parent
     output_files: list[Path] = []
-    part_num = 1
-    start = 0
-
-    while start < len(all_pages):
-        writer = PdfWriter()
-        end = start
-
-        for idx in range(start, len(all_pages)):
-            writer.add_page(all_pages[idx])
-
-            # Measure actual combined size in memory
-            buf = io.BytesIO()
-            writer.write(buf)
-            actual_size = buf.tell()
-
-            if actual_size > max_size_bytes:
-                if idx == start:
-                    # Single page exceeds limit — include it anyway
-                    end = idx + 1
-                else:
-                    # This page pushed us over; rebuild without it
-                    end = idx
-                    writer = PdfWriter()
-                    for i in range(start, end):
-                        writer.add_page(all_pages[i])
-                break
-
-            end = idx + 1
-        else:
-            # All remaining pages fit
-            end = len(all_pages)
-
-        # Determine output filename
-        if part_num == 1 and end >= len(all_pages):
-            part_path = output_path
-        else:
-            part_path = parent / f"{stem}_part{part_num}{suffix}"
+    pending: list[Future] = []
 
-        with open(part_path, "wb") as f:
-            writer.write(f)
+    def report(part_path: Path, n_pages: int) -> None:
         output_files.append(part_path)
-        print(f"  {part_path.name} — {end - start} pages, {get_file_size_mb(part_path):.1f} MB")
-
-        start = end
-        part_num += 1
+        size_mb = get_file_size_mb(part_path)
+        print(f"  {part_path.name} — {n_pages} pages, {size_mb:.1f} MB")
+        if size_mb > max_size_mb:
+            print(f"  WARNING: {part_path.name} is over the {max_size_mb} MB limit")
+
+    # Few workers: part writes are mostly I/O, and more would thrash an HDD.
+    # Spawn rather than fork: compression threads and gs pipes are still
+    # live here, and forking a threaded process can deadlock the child
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                             mp_context=multiprocessing.get_context("spawn")) as executor, \
+            ExitStack() as cleanup:
+
+        # Sources with pages in the current part, in order; runs index into
+        # it.  Only the newest _MAX_OPEN_SOURCES keep their handle (None
+        # once closed); the last part reopens the others by path.
+        part_sources: list[tuple[Path, pikepdf.Pdf | None]] = []
+        cleanup.callback(lambda: [src.close() for _, src in part_sources if src is not None])
+
+        def submit_part(runs: list[tuple[int, int, int]]) -> None:
+            part_path = parent / f"{stem}_part{len(pending) + 1}{suffix}"
+            paths = [(part_sources[i][0], start, stop) for i, start, stop in runs]
+            pending.append(executor.submit(_write_part, part_path, paths))
+            # Report parts that have finished, keeping output order
+            while len(output_files) < len(pending) and pending[len(output_files)].done():
+                report(*pending[len(output_files)].result())
+
+        # Size pages as sources arrive, recording the part as page runs
+        runs: list[tuple[int, int, int]] = []  # (index into part_sources, start, stop)
+        part_bytes = _PART_OVERHEAD
+        for pdf_path in pdf_paths:
+            src = pikepdf.open(pdf_path)
+            part_sources.append((pdf_path, src))
+            if len(part_sources) > _MAX_OPEN_SOURCES:
+                old_path, old_src = part_sources[-_MAX_OPEN_SOURCES - 1]
+                old_src.close()
+                part_sources[-_MAX_OPEN_SOURCES - 1] = (old_path, None)
+            start = 0  # first page of src in the current part
+            counted: set = set()  # objects of src already counted in this part
+            for n, page in enumerate(src.pages):
+                page_bytes, page_objects = _page_bytes(page, counted)
+                if part_bytes + page_bytes > max_size_bytes and (runs or n > start):
+                    # This page would push us over; close the part without it.
+                    # (A single page that exceeds the limit gets a part to itself.)
+                    if n > start:
+                        runs.append((len(part_sources) - 1, start, n))
+                    submit_part(runs)
+                    # Only src carries over into the next part
+                    for _, done in part_sources[:-1]:
+                        if done is not None:
+                            done.close()
+                    del part_sources[:-1]
+                    runs = []
+                    start = n
+                    part_bytes = _PART_OVERHEAD
+                    counted = set()
+                    page_bytes, page_objects = _page_bytes(page, counted)
+
+                part_bytes += page_bytes
+                counted |= page_objects
+            if len(src.pages) > start:
+                runs.append((len(part_sources) - 1, start, len(src.pages)))
+
+        # Save the last part here, from the handles sizing left open
+        last = None
+        if runs:
+            part_num = len(pending) + 1
+            if part_num == 1:
+                part_path = output_path
+            else:
+                part_path = parent / f"{stem}_part{part_num}{suffix}"
+            sources = [path if src is None else src for path, src in part_sources]
+            last = part_path, _save_pages(
+                part_path, [(sources[i], start, stop) for i, start, stop in runs])
+        for future in pending[len(output_files):]:
+            report(*future.result())
+        if last is not None:
+            report(*last)
 
     return output_files
 
@@ -213,8 +832,18 @@ def main():
         "--max-size", type=float, default=None, metavar="MB",
         help="Max output file size in MB; splits into multiple files if needed (e.g. --max-size 100)"
     )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, metavar="N",
+        help="Number of PDFs to compress in parallel (default: CPU count)"
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    try:
+        gs_settings(args.quality, args.dpi)
+    except ValueError as e:
+        parser.error(str(e))
     output_path = Path(args.output)
 
     # Collect input PDFs
@@ -239,33 +868,45 @@ def main():
         print("  Install: apt install ghostscript (Linux) / choco install ghostscript (Windows)")
         print()
 
-    # Process
-    compressed_pdfs = []
-    with tempfile.TemporaryDirectory() as tmpdir:
-        for i, pdf in enumerate(pdfs, 1):
-            if gs_cmd and not args.no_compress:
-                compressed_path = Path(tmpdir) / f"compressed_{i:03d}.pdf"
-                print(f"[{i}/{len(pdfs)}] Compressing {pdf.name}...", end=" ", flush=True)
-
-                if compress_pdf(gs_cmd, pdf, compressed_path, args.dpi, args.quality):
-                    old_size = get_file_size_mb(pdf)
-                    new_size = get_file_size_mb(compressed_path)
-                    reduction = (1 - new_size / old_size) * 100 if old_size > 0 else 0
-                    print(f"{old_size:.1f} MB → {new_size:.1f} MB ({reduction:.0f}% reduction)")
-                    compressed_pdfs.append(compressed_path)
-                else:
-                    print("failed, using original")
-                    compressed_pdfs.append(pdf)
-            else:
-                compressed_pdfs.append(pdf)
-
-        # Combine (and optionally split)
-        if args.max_size:
-            print(f"\nCombining {len(compressed_pdfs)} PDFs (max {args.max_size} MB per file)...")
+    if args.max_size:
+        target = f"parts of at most {args.max_size} MB"
+    else:
+        target = str(output_path)
+
+    # Intermediates go to tmpfs when there's room; allow for outputs (and
+    # two-tone pre-pass copies) up to twice the input size
+    scratch = None
+    if gs_cmd:
+        scratch = _scratch_dir(int(total_input_mb * 1024 * 1024 * 2))
+
+    # Process — each gs interpreter is single-threaded, so keep one
+    # persistent session per core.  combine_pdfs pulls results in input
+    # order as they finish, so combining overlaps the rest of compression.
+    with tempfile.TemporaryDirectory(dir=scratch) as tmpdir, ExitStack() as stack:
+        if gs_cmd and not args.no_compress:
+            work_dir = Path(tmpdir).resolve()
+            read_dirs = {pdf.resolve().parent for pdf in pdfs}
+            jobs = min(len(pdfs), args.jobs)
+            sessions: queue.Queue[GhostscriptSession] = queue.Queue()
+            for n in range(jobs):
+                session = GhostscriptSession(gs_cmd, work_dir, read_dirs,
+                                             args.dpi, args.quality, name=f"gs{n}")
+                stack.callback(session.close)
+                sessions.put(session)
+
+            print(f"Compressing {len(pdfs)} PDF(s) with {jobs} parallel job(s), "
+                  f"combining into {target} as they finish...")
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=jobs))
+            futures = [
+                executor.submit(_compress_one, i, pdf, work_dir, args.dpi, sessions)
+                for i, pdf in enumerate(pdfs, 1)
+            ]
+            combine_inputs = _compressed_in_order(futures, pdfs)
         else:
-            print(f"\nCombining {len(compressed_pdfs)} PDFs into {output_path}...")
+            print(f"Combining {len(pdfs)} PDFs into {target}...")
+            combine_inputs = pdfs
 
-        output_files = combine_pdfs(compressed_pdfs, output_path, args.max_size)
+        output_files = combine_pdfs(combine_inputs, output_path, args.max_size)
 
     # Summary
     if len(output_files) == 1: